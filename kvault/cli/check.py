@@ -15,7 +15,7 @@ import json
 import sys
 from datetime import date, datetime, timedelta
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 import click
 
@@ -107,6 +107,13 @@ def check_propagation(kb_root: Path, threshold_minutes: int) -> List[str]:
     """
     warnings = []
     threshold = timedelta(minutes=threshold_minutes)
+    updated_dates: Dict[Path, Optional[date]] = {}
+
+    def updated_date(path: Path) -> Optional[date]:
+        # Interior summaries are checked once as a parent and once as a child.
+        if path not in updated_dates:
+            updated_dates[path] = _get_updated_date(path)
+        return updated_dates[path]
 
     for summary in kb_root.rglob("_summary.md"):
         parent_dir = summary.parent
@@ -121,10 +128,10 @@ def check_propagation(kb_root: Path, threshold_minutes: int) -> List[str]:
         if not children:
             continue
 
-        parent_date = _get_updated_date(summary)
+        parent_date = updated_date(summary)
 
         for child in children:
-            child_date = _get_updated_date(child)
+            child_date = updated_date(child)
 
             stale = False
             detail = ""
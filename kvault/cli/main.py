@@ -1,6 +1,7 @@
 """kvault CLI — CLI-first knowledge base for AI agents."""
 
 import json
+import re
 from datetime import date
 from importlib.resources import files as resource_files
 from pathlib import Path
@@ -24,16 +25,18 @@ from kvault.core import operations as ops
 # Helpers
 # -------------------------
 
+_PLACEHOLDER_RE = re.compile(r"\{\{([A-Z_]+)\}\}")
+
 
 def _load_template(name: str) -> str:
     return resource_files("kvault.templates").joinpath(name).read_text()
 
 
 def _render(template: str, replacements: Dict[str, str]) -> str:
-    result = template
-    for key, value in replacements.items():
-        result = result.replace("{{" + key + "}}", value)
-    return result
+    # One pass over the template; substituted values are never re-scanned.
+    return _PLACEHOLDER_RE.sub(
+        lambda match: replacements.get(match.group(1), match.group(0)), template
+    )
 
 
 # -------------------------
@@ -145,7 +148,7 @@ def init_kb(ctx: click.Context, path: Path, name: str) -> None:
 
     kvault_dir = path / ".kvault"
     kvault_dir.mkdir(parents=True, exist_ok=True)
-    ObservabilityLogger(kvault_dir / "logs.db")
+    ObservabilityLogger(kvault_dir / "logs.db").close()
 
     click.echo(f"Initialized knowledge base at {path}")
     click.echo(f"Owner: {name}")
@@ -336,8 +339,8 @@ def log_summary(db_path: Path, session_id: Optional[str], as_json: bool) -> None
     if not db_path.exists():
         raise click.ClickException(f"Log database does not exist: {db_path}")
 
-    logger = ObservabilityLogger(db_path)
-    summary = logger.get_session_summary(session_id=session_id)
+    with ObservabilityLogger(db_path) as logger:
+        summary = logger.get_session_summary(session_id=session_id)
 
     if as_json:
         click.echo(json.dumps(summary, indent=2, sort_keys=True))
@@ -10,10 +10,16 @@ from dataclasses import dataclass
 from datetime import date, datetime, timedelta
 from pathlib import Path
 import re
-from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from kvault.core.frontmatter import parse_frontmatter
 
+# Heading keywords as one alternation each, matched against lowercased headings.
+_GOAL_KEYWORDS_RE = re.compile(r"goal|priority|focus|objective|north star")
+_PROJECT_KEYWORDS_RE = re.compile(r"next|priority|upcoming|action|roadmap|plan")
+_HEADING_RE = re.compile(r"^#{1,6}\s+(.+)$")
+_JOURNAL_DATE_HEADING_RE = re.compile(r"^##\s+(\d{4}-\d{2}-\d{2})$")
+
 
 @dataclass(frozen=True)
 class DailyArtifactResult:
@@ -44,7 +50,7 @@ def _read_markdown_body(path: Path) -> str:
     return body.strip()
 
 
-def _extract_section_by_keywords(markdown: str, keywords: Sequence[str]) -> str:
+def _extract_section_by_keywords(markdown: str, keywords: re.Pattern[str]) -> str:
     """Extract the first heading section whose title matches one of the keywords."""
     if not markdown.strip():
         return ""
@@ -52,7 +58,7 @@ def _extract_section_by_keywords(markdown: str, keywords: Sequence[str]) -> str:
     lines = markdown.splitlines()
     heading_indexes: List[Tuple[int, str]] = []
     for idx, line in enumerate(lines):
-        match = re.match(r"^#{1,6}\s+(.+)$", line.strip())
+        match = _HEADING_RE.match(line.strip())
         if match:
             heading_indexes.append((idx, match.group(1).strip().lower()))
 
@@ -60,11 +66,10 @@ def _extract_section_by_keywords(markdown: str, keywords: Sequence[str]) -> str:
         return ""
 
     heading_indexes.append((len(lines), ""))
-    normalized_keywords = [k.lower() for k in keywords]
 
     for i in range(len(heading_indexes) - 1):
         start_idx, heading_text = heading_indexes[i]
-        if not any(keyword in heading_text for keyword in normalized_keywords):
+        if not keywords.search(heading_text):
             continue
         end_idx = heading_indexes[i + 1][0]
         section = "\n".join(lines[start_idx:end_idx]).strip()
@@ -96,7 +101,7 @@ def _extract_journal_sections(journal_content: str, up_to: date) -> List[str]:
         end = section_starts[i + 1]
         heading = lines[start].strip()
 
-        heading_match = re.match(r"^##\s+(\d{4}-\d{2}-\d{2})$", heading)
+        heading_match = _JOURNAL_DATE_HEADING_RE.match(heading)
         if heading_match:
             entry_date = parse_iso_date(heading_match.group(1))
             if entry_date > up_to:
@@ -154,14 +159,14 @@ def _build_daily_content(
 
     goal_section = _extract_section_by_keywords(
         root_summary,
-        keywords=("goal", "priority", "focus", "objective", "north star"),
+        keywords=_GOAL_KEYWORDS_RE,
     )
     if not goal_section:
         goal_section = _first_n_lines(root_summary, max_lines=25)
 
     project_near_term = _extract_section_by_keywords(
         projects_summary,
-        keywords=("next", "priority", "upcoming", "action", "roadmap", "plan"),
+        keywords=_PROJECT_KEYWORDS_RE,
     )
     if not project_near_term:
         project_near_term = _first_n_lines(projects_summary, max_lines=30)
@@ -14,6 +14,7 @@ events a day; directories stay tiny).
 """
 
 import hashlib
+import json
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional
@@ -345,8 +346,6 @@ def import_moss_capture(
     as source_ref.  When a record id appears in both files, the processed
     (archived) copy wins.
     """
-    import json as _json
-
     records: Dict[str, Dict[str, Any]] = {}
     counts = {"open": 0, "archived": 0, "invalid": 0, "duplicate": 0, "conflict": 0}
 
@@ -360,7 +359,7 @@ def import_moss_capture(
             if not line:
                 continue
             try:
-                record = _json.loads(line)
+                record = json.loads(line)
             except ValueError:
                 counts["invalid"] += 1
                 continue
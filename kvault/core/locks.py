@@ -63,7 +63,11 @@ def _pid_alive(pid: int) -> bool:
 
 
 class KBWriteLock:
-    """Per-KB advisory write lock, reentrant within the owning process.
+    """Per-KB advisory write lock, reentrant within the owning thread.
+
+    Other threads of the same process wait on the lock directory exactly like
+    other processes do, so a threaded host (e.g. the MCP server) cannot
+    interleave two mutations.
 
     Usage::
 
@@ -71,8 +75,7 @@ class KBWriteLock:
             ...mutate the KB...
     """
 
-    _local_depth: Dict[str, int] = {}
-    _local_guard = threading.RLock()
+    _local = threading.local()
 
     def __init__(self, kg_root: Union[str, Path], timeout: float = 10.0):
         self.root = Path(kg_root).expanduser().resolve()
@@ -80,6 +83,14 @@ class KBWriteLock:
         self.lock_dir = self.root / ".kvault" / LOCK_DIR_NAME
         self._key = str(self.root)
 
+    @classmethod
+    def _local_depth(cls) -> Dict[str, int]:
+        """Return this thread's hold depth per KB root."""
+        depths = getattr(cls._local, "depths", None)
+        if depths is None:
+            depths = cls._local.depths = {}
+        return depths
+
     # -- staleness ---------------------------------------------------------
 
     def _owner_metadata(self) -> Optional[Dict[str, Any]]:
@@ -123,11 +134,11 @@ class KBWriteLock:
     # -- acquire/release ---------------------------------------------------
 
     def acquire(self) -> None:
-        with self._local_guard:
-            depth = self._local_depth.get(self._key, 0)
-            if depth > 0:
-                self._local_depth[self._key] = depth + 1
-                return
+        depths = self._local_depth()
+        depth = depths.get(self._key, 0)
+        if depth > 0:
+            depths[self._key] = depth + 1
+            return
 
         deadline = time.monotonic() + self.timeout
         while True:
@@ -156,17 +167,16 @@ class KBWriteLock:
                     }
                 ),
             )
-            with self._local_guard:
-                self._local_depth[self._key] = 1
+            depths[self._key] = 1
             return
 
     def release(self) -> None:
-        with self._local_guard:
-            depth = self._local_depth.get(self._key, 0)
-            if depth > 1:
-                self._local_depth[self._key] = depth - 1
-                return
-            self._local_depth.pop(self._key, None)
+        depths = self._local_depth()
+        depth = depths.get(self._key, 0)
+        if depth > 1:
+            depths[self._key] = depth - 1
+            return
+        depths.pop(self._key, None)
         shutil.rmtree(self.lock_dir, ignore_errors=True)
 
     def __enter__(self) -> "KBWriteLock":
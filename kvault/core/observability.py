@@ -6,11 +6,22 @@ Logs agent decisions with structured data for analysis.
 
 import json
 import sqlite3
+import threading
 import uuid
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# WAL lets readers (``kvault log summary``) run alongside a writer; under WAL,
+# synchronous=NORMAL skips the per-commit fsync and can only lose the most
+# recent commits on power loss, never corrupt the log.
+_CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+)
 
 
 @dataclass
@@ -58,6 +69,7 @@ class ObservabilityLogger:
         "step_rebuild",
         "step_refactor",
     ]
+    _PHASE_SET = frozenset(PHASES)
 
     def __init__(self, db_path: Path):
         """Initialize logger with database path.
@@ -67,12 +79,43 @@ class ObservabilityLogger:
         """
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
         self._init_db()
         self.session_id = self._new_session()
 
+    def __enter__(self) -> "ObservabilityLogger":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the database connection. Later calls reopen it."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    @contextmanager
+    def _db(self) -> Iterator[sqlite3.Connection]:
+        """Yield the logger's connection inside a commit-or-rollback block.
+
+        One connection is opened lazily and reused for the logger's lifetime
+        instead of reconnecting on every log or query.
+        """
+        with self._lock:
+            if self._conn is None:
+                self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+                self._conn.row_factory = sqlite3.Row
+                for pragma in _CONNECTION_PRAGMAS:
+                    self._conn.execute(pragma)
+            with self._conn as conn:
+                yield conn
+
     def _init_db(self) -> None:
         """Create tables if they don't exist."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._db() as conn:
             conn.executescript(
                 """
                 -- Main logs table
@@ -85,8 +128,12 @@ class ObservabilityLogger:
                 );
 
                 CREATE INDEX IF NOT EXISTS idx_session ON logs(session);
-                CREATE INDEX IF NOT EXISTS idx_phase ON logs(phase);
                 CREATE INDEX IF NOT EXISTS idx_ts ON logs(ts);
+                -- Phase queries filter on phase and read newest-first by ts;
+                -- (phase, ts) serves both without a sort. It supersedes the
+                -- old phase-only index, which would just add write cost.
+                CREATE INDEX IF NOT EXISTS idx_phase_ts ON logs(phase, ts);
+                DROP INDEX IF EXISTS idx_phase;
 
                 -- Analysis views
                 CREATE VIEW IF NOT EXISTS errors AS
@@ -127,13 +174,9 @@ class ObservabilityLogger:
             phase: Phase name (input, research, decide, write, propagate, error, or step_*)
             data: Structured data for the log entry
         """
-        # Allow any phase that's in PHASES or starts with "step_"
-        if phase not in self.PHASES and not phase.startswith("step_"):
-            raise ValueError(
-                f"Invalid phase: {phase}. Must be one of {self.PHASES} or start with 'step_'"
-            )
+        self._check_phase(phase)
 
-        with sqlite3.connect(self.db_path) as conn:
+        with self._db() as conn:
             conn.execute(
                 """
                 INSERT INTO logs (session, phase, data)
@@ -142,6 +185,38 @@ class ObservabilityLogger:
                 (self.session_id, phase, json.dumps(data, default=str)),
             )
 
+    def log_many(self, entries: Iterable[Tuple[str, Dict[str, Any]]]) -> None:
+        """Log several phases in a single transaction.
+
+        Every phase is validated before anything is written, so an invalid
+        entry leaves the log untouched.
+
+        Args:
+            entries: (phase, data) pairs, logged in order
+        """
+        rows = []
+        for phase, data in entries:
+            self._check_phase(phase)
+            rows.append((self.session_id, phase, json.dumps(data, default=str)))
+        if not rows:
+            return
+
+        with self._db() as conn:
+            conn.executemany(
+                """
+                INSERT INTO logs (session, phase, data)
+                VALUES (?, ?, ?)
+                """,
+                rows,
+            )
+
+    def _check_phase(self, phase: str) -> None:
+        # Allow any phase that's in PHASES or starts with "step_"
+        if phase not in self._PHASE_SET and not phase.startswith("step_"):
+            raise ValueError(
+                f"Invalid phase: {phase}. Must be one of {self.PHASES} or start with 'step_'"
+            )
+
     # Convenience methods
 
     def log_input(self, items: List[Dict], source: Optional[str] = None) -> None:
@@ -296,8 +371,7 @@ class ObservabilityLogger:
         """
         session_id = session_id or self.session_id
 
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._db() as conn:
             rows = conn.execute(
                 "SELECT * FROM logs WHERE session = ? ORDER BY id",
                 (session_id,),
@@ -324,8 +398,7 @@ class ObservabilityLogger:
         Returns:
             List of error LogEntry objects
         """
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._db() as conn:
 
             if since:
                 rows = conn.execute(
@@ -367,8 +440,7 @@ class ObservabilityLogger:
         Returns:
             List of decision LogEntry objects
         """
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._db() as conn:
 
             if action:
                 rows = conn.execute(
@@ -409,8 +481,7 @@ class ObservabilityLogger:
         Returns:
             List of low-confidence LogEntry objects
         """
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._db() as conn:
             rows = conn.execute(
                 """
                 SELECT * FROM logs
@@ -435,7 +506,7 @@ class ObservabilityLogger:
 
     def list_sessions(self, limit: int = 20) -> List[str]:
         """List recent session IDs by most recent activity."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._db() as conn:
             rows = conn.execute(
                 """
                 SELECT session
@@ -457,7 +528,7 @@ class ObservabilityLogger:
         Returns:
             Dictionary with summary statistics
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._db() as conn:
             resolved_session_id = session_id
             if resolved_session_id is None:
                 row = conn.execute("SELECT session FROM logs ORDER BY id DESC LIMIT 1").fetchone()
@@ -17,10 +17,13 @@ import json
 import os
 import re
 import shutil
+from collections import Counter
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
 
+from kvault.core.events import check_events_promotable, promote_events
 from kvault.core.frontmatter import (
     FrontmatterError,
     build_frontmatter,
@@ -33,6 +36,7 @@ from kvault.core.paths import (
     resolve_node_path,
     validate_node_target,
 )
+from kvault.core.search import search_nodes as _search_nodes
 from kvault.core.storage import (
     SimpleStorage,
     count_entities,
@@ -61,6 +65,7 @@ _PLACEHOLDER_LINE_RE = re.compile(
     r"(?:tbd|tbc|todo|to be determined|to be added|placeholder|\(placeholder\)|fill in)\.?$",
     re.IGNORECASE,
 )
+_SEVERITY_ORDER = {"error": 0, "warning": 1, "info": 2}
 SUMMARY_UPDATE_DIGEST_ALGORITHM = "direct-child-summary-sha256-v1"
 MAX_DIRECT_CHILDREN = 10
 
@@ -98,10 +103,15 @@ def validate_allowed_root(candidate_root: Path) -> Optional[str]:
     )
 
 
-def validate_within_root(kg_root: Path, path: str) -> bool:
-    """Return True if *path* resolves inside *kg_root*."""
+def validate_within_root(kg_root: Path, path: str, root_resolved: Optional[Path] = None) -> bool:
+    """Return True if *path* resolves inside *kg_root*.
+
+    Callers checking many paths under one root can pass *root_resolved*
+    (``kg_root.resolve()``) so the root is not re-resolved per call.
+    """
     resolved = (kg_root / path).resolve()
-    root_resolved = kg_root.resolve()
+    if root_resolved is None:
+        root_resolved = kg_root.resolve()
     try:
         resolved.relative_to(root_resolved)
         return True
@@ -158,14 +168,18 @@ def build_outline(
     """
     path = _normalize_node_path(path)
     is_valid, _ = _validate_node_path(path)
-    if not is_valid or not validate_within_root(kg_root, path):
+    root_resolved = kg_root.resolve()
+    if not is_valid or not validate_within_root(kg_root, path, root_resolved):
         return None
     visited: Set[Path] = set()
-    return _walk_outline(kg_root, path, depth, max_children, include_gist, 0, visited)
+    return _walk_outline(
+        kg_root, root_resolved, path, depth, max_children, include_gist, 0, visited
+    )
 
 
 def _walk_outline(
     kg_root: Path,
+    root_resolved: Path,
     path: str,
     depth: Optional[int],
     max_children: Optional[int],
@@ -173,7 +187,7 @@ def _walk_outline(
     level: int,
     visited: Set[Path],
 ) -> Optional[Dict[str, Any]]:
-    raw = _read_node_raw(kg_root, path)
+    raw = _read_node_raw(kg_root, path, root_resolved)
     if raw is None:
         return None
     node_dir = (kg_root if path == "." else kg_root / path).resolve()
@@ -187,7 +201,14 @@ def _walk_outline(
     children: List[Dict[str, Any]] = []
     for child_path in _child_node_paths(kg_root, path):
         child = _walk_outline(
-            kg_root, child_path, depth, max_children, include_gist, level + 1, visited
+            kg_root,
+            root_resolved,
+            child_path,
+            depth,
+            max_children,
+            include_gist,
+            level + 1,
+            visited,
         )
         if child is not None:
             children.append(child)
@@ -247,13 +268,15 @@ def _walk_outline(
 
 def outline_counts(outline: Dict[str, Any]) -> Dict[str, int]:
     """Total nodes in the walked subtree vs nodes shown after pruning."""
-
-    def _shown(node: Dict[str, Any]) -> int:
-        return 1 + sum(_shown(c) for c in node["children"])
-
+    shown = 0
+    pending = [outline]
+    while pending:
+        node = pending.pop()
+        shown += 1
+        pending.extend(node["children"])
     return {
         "total_nodes": outline["descendants_count"] + 1,
-        "shown_nodes": _shown(outline),
+        "shown_nodes": shown,
     }
 
 
@@ -328,45 +351,47 @@ def _summary_rel_path(path: str) -> str:
     return "_summary.md" if path == "." else f"{path}/_summary.md"
 
 
-def _safe_iterdir(path: Path) -> Iterable[Path]:
+def _child_node_names(node_dir: Path) -> Iterator[str]:
+    """Yield names of visible child directories that carry a ``_summary.md``."""
     try:
-        return list(path.iterdir())
+        with os.scandir(node_dir) as entries:
+            for entry in entries:
+                if entry.name.startswith(".") or not entry.is_dir():
+                    continue
+                if os.path.exists(os.path.join(entry.path, "_summary.md")):
+                    yield entry.name
     except OSError:
-        return []
+        return
 
 
 def _parent_path(path: str) -> Optional[str]:
     if path == ".":
         return None
-    parts = Path(path).parts
-    if len(parts) <= 1:
-        return "."
-    return str(Path(*parts[:-1]))
+    parent, sep, _ = path.rpartition("/")
+    return parent if sep else "."
 
 
 def _ancestor_node_paths(path: str) -> List[str]:
     if path == ".":
         return []
+    # Ancestors of a validated node path are its prefixes up to each separator,
+    # so slice them out of the one string instead of re-parsing every level.
     ancestors: List[str] = []
-    current = _parent_path(path)
-    while current is not None:
-        ancestors.append(current)
-        current = _parent_path(current)
+    end = path.rfind("/")
+    while end > 0:
+        ancestors.append(path[:end])
+        end = path.rfind("/", 0, end)
+    ancestors.append(".")
     return ancestors
 
 
 def _node_kind(kg_root: Path, path: str) -> str:
     if path == ".":
         return "root"
-    parts = Path(path).parts
-    node_dir = kg_root / path
-    has_child_nodes = any(
-        child.is_dir() and not child.name.startswith(".") and (child / "_summary.md").exists()
-        for child in _safe_iterdir(node_dir)
-    )
-    if len(parts) < 2 or has_child_nodes:
+    if "/" not in path:
         return "category"
-    return "entity"
+    has_child_nodes = next(_child_node_names(kg_root / path), None) is not None
+    return "category" if has_child_nodes else "entity"
 
 
 def _extract_title(path: str, meta: Dict[str, Any], content: str) -> str:
@@ -380,19 +405,22 @@ def _extract_title(path: str, meta: Dict[str, Any], content: str) -> str:
     return _default_title("." if path == "." else path.split("/")[-1])
 
 
-def _read_node_raw(kg_root: Path, path: str) -> Optional[Dict[str, Any]]:
+def _read_node_raw(
+    kg_root: Path, path: str, root_resolved: Optional[Path] = None
+) -> Optional[Dict[str, Any]]:
     path = _normalize_node_path(path)
     is_valid, err_msg = _validate_node_path(path)
-    if not is_valid or not validate_within_root(kg_root, path):
+    if not is_valid or not validate_within_root(kg_root, path, root_resolved):
         return None
 
-    summary_path = _summary_path_for_node(kg_root, path)
+    node_dir = kg_root if path == "." else kg_root / path
+    summary_path = node_dir / "_summary.md"
     if not summary_path.exists():
         return None
     raw = summary_path.read_text()
     meta, body = parse_frontmatter(raw)
     if not meta:
-        meta_path = (kg_root if path == "." else kg_root / path) / "_meta.json"
+        meta_path = node_dir / "_meta.json"
         if meta_path.exists():
             with open(meta_path) as f:
                 meta = json.load(f)
@@ -413,7 +441,7 @@ def _node_handle(kg_root: Path, path: str) -> Dict[str, Any]:
     raw = _read_node_raw(kg_root, path) or {}
     return {
         "path": path,
-        "kind": _node_kind(kg_root, path),
+        "kind": raw.get("kind") or _node_kind(kg_root, path),
         "title": raw.get("title")
         or _extract_title(path, raw.get("meta", {}), raw.get("content", "")),
         "summary_path": _summary_rel_path(path),
@@ -421,16 +449,9 @@ def _node_handle(kg_root: Path, path: str) -> Dict[str, Any]:
 
 
 def _child_node_paths(kg_root: Path, path: str) -> List[str]:
-    node_dir = kg_root if path == "." else kg_root / path
-    children: List[str] = []
-    for child in _safe_iterdir(node_dir):
-        if not child.is_dir() or child.name.startswith("."):
-            continue
-        if not (child / "_summary.md").exists():
-            continue
-        rel_path = str(child.relative_to(kg_root))
-        children.append(rel_path)
-    return sorted(children)
+    if path == ".":
+        return sorted(_child_node_names(kg_root))
+    return sorted(f"{path}/{name}" for name in _child_node_names(kg_root / path))
 
 
 def _read_node_shallow(kg_root: Path, path: str) -> Optional[Dict[str, Any]]:
@@ -490,7 +511,7 @@ def _direct_child_raw_nodes(kg_root: Path, path: str) -> List[Dict[str, Any]]:
 
 
 def _children_digest(parent_path: str, children: List[Dict[str, Any]]) -> str:
-    sorted_children = sorted(children, key=lambda child: child["path"])
+    sorted_children = sorted(children, key=itemgetter("path"))
     payload = {
         "algorithm": SUMMARY_UPDATE_DIGEST_ALGORITHM,
         "parent_path": parent_path,
@@ -566,7 +587,7 @@ def _read_entity_raw(kg_root: Path, entity_path: str) -> Optional[Dict[str, Any]
         "path": entity_path,
         "meta": meta,
         "content": body if meta else content,
-        "has_frontmatter": bool(meta) and summary_path.exists(),
+        "has_frontmatter": bool(meta),
     }
 
 
@@ -748,6 +769,14 @@ def write_node(
     is_valid, err_msg = _validate_node_path(path)
     if not is_valid:
         return error_response(ErrorCode.VALIDATION_ERROR, err_msg or "Invalid path")
+    # Input-shape checks go before anything that touches the filesystem.
+    if meta is not None and not isinstance(meta, dict):
+        return error_response(
+            ErrorCode.VALIDATION_ERROR,
+            "frontmatter field 'meta' must be an object when provided",
+            hint="Pass meta as a JSON object, or omit it to reuse/apply defaults",
+        )
+
     if not validate_within_root(kg_root, path):
         return error_response(ErrorCode.VALIDATION_ERROR, "Path escapes KB root")
 
@@ -757,8 +786,6 @@ def write_node(
         return error_response(ErrorCode.VALIDATION_ERROR, str(exc))
 
     if event_ids:
-        from kvault.core.events import check_events_promotable
-
         promotable = check_events_promotable(kg_root, event_ids)
         if not promotable.get("success"):
             return promotable
@@ -780,13 +807,6 @@ def write_node(
             hint="Use create=true to create new entity",
         )
 
-    if meta is not None and not isinstance(meta, dict):
-        return error_response(
-            ErrorCode.VALIDATION_ERROR,
-            "frontmatter field 'meta' must be an object when provided",
-            hint="Pass meta as a JSON object, or omit it to reuse/apply defaults",
-        )
-
     try:
         meta = _resolve_entity_meta(
             kg_root=kg_root,
@@ -871,8 +891,6 @@ def write_node(
         "created": create,
     }
     if event_ids:
-        from kvault.core.events import promote_events
-
         promotion = promote_events(kg_root, event_ids, path)
         result["events"] = promotion
         if not promotion.get("success"):
@@ -1105,14 +1123,13 @@ def list_nodes(kg_root: Path, path: str = ".", recursive: bool = False) -> List[
         return []
 
     nodes: List[Dict[str, Any]] = []
-
-    def _walk(parent: str) -> None:
-        for child in _child_node_paths(kg_root, parent):
-            nodes.append(_node_handle(kg_root, child))
-            if recursive:
-                _walk(child)
-
-    _walk(path)
+    # Explicit stack, children pushed in reverse, keeps the sorted pre-order.
+    pending = _child_node_paths(kg_root, path)[::-1]
+    while pending:
+        child = pending.pop()
+        nodes.append(_node_handle(kg_root, child))
+        if recursive:
+            pending.extend(reversed(_child_node_paths(kg_root, child)))
     return nodes
 
 
@@ -1125,8 +1142,6 @@ def search_nodes(
     total_max_chars: int = 20000,
 ) -> Dict[str, Any]:
     """Search visible kvault node summaries."""
-    from kvault.core.search import search_nodes as _search_nodes
-
     return _search_nodes(
         kg_root,
         query=query,
@@ -1337,15 +1352,15 @@ def validate_kb(kg_root: Path) -> Dict[str, Any]:
                     }
                 )
 
-    severity_order = {"error": 0, "warning": 1, "info": 2}
-    issues.sort(key=lambda x: severity_order.get(x["severity"], 99))
+    issues.sort(key=lambda x: _SEVERITY_ORDER.get(x["severity"], 99))
+    severity_counts = Counter(issue["severity"] for issue in issues)
     return {
-        "valid": len([i for i in issues if i["severity"] in ("error", "warning")]) == 0,
+        "valid": severity_counts["error"] + severity_counts["warning"] == 0,
         "issue_count": len(issues),
         "issues": issues,
         "summary": {
-            "errors": len([i for i in issues if i["severity"] == "error"]),
-            "warnings": len([i for i in issues if i["severity"] == "warning"]),
-            "info": len([i for i in issues if i["severity"] == "info"]),
+            "errors": severity_counts["error"],
+            "warnings": severity_counts["warning"],
+            "info": severity_counts["info"],
         },
     }
@@ -7,16 +7,26 @@ dependency-light so downstream agents/adapters can share one matching policy.
 
 from dataclasses import dataclass
 from difflib import SequenceMatcher
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
 
-from kvault.core.storage import normalize_entity_id, scan_entities
+from kvault.core.slots import FrozenSlotsMixin
+from kvault.core.storage import EntityRecord, normalize_entity_id, scan_entities
 
 
 @dataclass(frozen=True)
-class ResearchCandidate:
+class ResearchCandidate(FrozenSlotsMixin):
     """A ranked candidate returned by entity research."""
 
+    __slots__ = (
+        "candidate_path",
+        "candidate_name",
+        "match_type",
+        "match_score",
+        "match_details",
+    )
+
     candidate_path: str
     candidate_name: str
     match_type: str
@@ -24,6 +34,41 @@ class ResearchCandidate:
     match_details: Dict[str, Any]
 
 
+@dataclass(frozen=True)
+class _EntityKeys:
+    """Normalized match keys for one cached entity."""
+
+    __slots__ = (
+        "entity",
+        "name_norm",
+        "leaf_norm",
+        "alias_norms",
+        "aliases_lower",
+        "comparison_pool",
+    )
+
+    entity: EntityRecord
+    name_norm: str
+    leaf_norm: str
+    alias_norms: FrozenSet[str]
+    aliases_lower: FrozenSet[str]
+    comparison_pool: Tuple[str, ...]
+
+
+def _keys_for(entity: EntityRecord) -> _EntityKeys:
+    name_norm = normalize_entity_id(entity.name)
+    leaf_norm = normalize_entity_id(Path(entity.path).name)
+    alias_norms = frozenset(normalize_entity_id(str(a)) for a in entity.aliases if a)
+    return _EntityKeys(
+        entity=entity,
+        name_norm=name_norm,
+        leaf_norm=leaf_norm,
+        alias_norms=alias_norms,
+        aliases_lower=frozenset(str(a).lower() for a in entity.aliases if a),
+        comparison_pool=(name_norm, leaf_norm, *alias_norms),
+    )
+
+
 class EntityResearcher:
     """Filesystem-backed entity researcher for dedup/reconciliation."""
 
@@ -36,21 +81,35 @@ class EntityResearcher:
     def __init__(self, kg_root: Path):
         self.kg_root = Path(kg_root)
         self._entity_cache = None
+        self._keys_cache: Optional[List[_EntityKeys]] = None
 
     def invalidate(self) -> None:
         """Invalidate in-memory entity cache after writes."""
         self._entity_cache = None
+        self._keys_cache = None
 
     def _entities(self):
         if self._entity_cache is None:
             self._entity_cache = scan_entities(self.kg_root)
         return self._entity_cache
 
+    def _entity_keys(self) -> List[_EntityKeys]:
+        # Normalizing every name and alias is the bulk of a research() call, and
+        # it only depends on the entity cache, so it is shared the same way.
+        if self._keys_cache is None:
+            self._keys_cache = [_keys_for(entity) for entity in self._entities()]
+        return self._keys_cache
+
     @staticmethod
-    def _similarity(a: str, b: str) -> float:
+    def _similarity(a: str, b: str, floor: float = 0.0) -> float:
         if not a or not b:
             return 0.0
-        return SequenceMatcher(None, a, b).ratio()
+        matcher = SequenceMatcher(None, a, b)
+        # Both quick ratios are cheap upper bounds on ratio(); pairs that cannot
+        # reach *floor* skip the full matching-blocks pass.
+        if matcher.real_quick_ratio() < floor or matcher.quick_ratio() < floor:
+            return 0.0
+        return matcher.ratio()
 
     def research(
         self,
@@ -65,14 +124,16 @@ class EntityResearcher:
         alias_norms = [normalize_entity_id(str(a)) for a in aliases if a]
         email_norm = email.lower().strip() if email else None
         email_domain = email_norm.split("@", 1)[1] if email_norm and "@" in email_norm else None
+        query_terms = [term for term in [target_norm, *alias_norms] if term]
 
         candidates: List[ResearchCandidate] = []
 
-        for entity in self._entities():
-            entity_name_norm = normalize_entity_id(entity.name)
-            path_leaf_norm = normalize_entity_id(Path(entity.path).name)
-            entity_alias_norms = {normalize_entity_id(str(a)) for a in entity.aliases if a}
-            entity_aliases_lower = {str(a).lower() for a in entity.aliases if a}
+        for keys in self._entity_keys():
+            entity = keys.entity
+            entity_name_norm = keys.name_norm
+            path_leaf_norm = keys.leaf_norm
+            entity_alias_norms = keys.alias_norms
+            entity_aliases_lower = keys.aliases_lower
 
             best_type = ""
             best_score = 0.0
@@ -95,19 +156,15 @@ class EntityResearcher:
                 best_score = 0.90
                 best_details = {"domain": email_domain}
             else:
-                comparison_pool = [entity_name_norm, path_leaf_norm] + list(entity_alias_norms)
-                query_terms = [target_norm] + [a for a in alias_norms if a]
-
                 fuzzy_score = 0.0
                 fuzzy_term = ""
                 fuzzy_target = ""
                 for query in query_terms:
-                    if not query:
-                        continue
-                    for target in comparison_pool:
+                    for target in keys.comparison_pool:
                         if not target:
                             continue
-                        score = self._similarity(query, target)
+                        floor = max(self.FUZZY_MATCH_THRESHOLD, fuzzy_score)
+                        score = self._similarity(query, target, floor)
                         if score > fuzzy_score:
                             fuzzy_score = score
                             fuzzy_term = query
@@ -129,7 +186,7 @@ class EntityResearcher:
                     )
                 )
 
-        candidates.sort(key=lambda c: c.match_score, reverse=True)
+        candidates.sort(key=attrgetter("match_score"), reverse=True)
         return candidates[:max_results]
 
     def suggest_action(
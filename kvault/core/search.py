@@ -7,23 +7,39 @@ The default backend is intentionally stateless and file-native: scan visible
 from __future__ import annotations
 
 import math
+import os
 import re
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
 
 from kvault.core.frontmatter import parse_frontmatter
+from kvault.core.slots import FrozenSlotsMixin
 
 _TOKEN_RE = re.compile(r"[a-z0-9]+")
 _H_RE = re.compile(r"^\s{0,3}#{1,6}\s+(.+?)\s*$", re.MULTILINE)
+_WHITESPACE_RE = re.compile(r"\s+")
 _SNIPPET_MAX_CHARS = 440
 
 
 @dataclass(frozen=True)
-class SearchDocument:
+class SearchDocument(FrozenSlotsMixin):
     """A searchable kvault node summary."""
 
+    # One instance per node per search; slots keep them small and attribute
+    # reads off the instance dict. (dataclass(slots=True) needs Python 3.10.)
+    __slots__ = (
+        "path",
+        "kind",
+        "title",
+        "aliases",
+        "headings",
+        "content",
+        "summary_path",
+        "last_updated",
+    )
+
     path: str
     kind: str
     title: str
@@ -79,15 +95,16 @@ def search_nodes(
     if not query:
         return {"query": query, "count": 0, "results": []}
 
-    documents = scan_search_documents(kg_root)
     query_tokens = _tokens(query)
     if not query_tokens:
         return {"query": query, "count": 0, "results": []}
 
+    documents = scan_search_documents(kg_root)
+
     idf = _idf(documents, query_tokens)
     scored: List[Tuple[float, SearchDocument, Set[str]]] = []
     for doc in documents:
-        score, matched_fields = _score_document(doc, query, query_tokens, idf)
+        score, matched_fields = _score_document(doc, query_tokens, idf)
         if score > 0:
             scored.append((score, doc, matched_fields))
 
@@ -126,18 +143,16 @@ def search_nodes(
 def scan_search_documents(kg_root: Path) -> List[SearchDocument]:
     """Return searchable documents for every visible ``_summary.md`` node."""
     kg_root = Path(kg_root)
-    documents: List[SearchDocument] = []
-    for summary_path in sorted(kg_root.rglob("_summary.md")):
-        try:
-            rel_summary = summary_path.relative_to(kg_root)
-        except ValueError:
-            continue
-        if _is_hidden(rel_summary.parts):
-            continue
+    summary_paths, parent_nodes = _walk_visible_summaries(kg_root)
+    visible = [(path, path.relative_to(kg_root)) for path in summary_paths]
+    # Every visible node's parent has a child node, so the walk alone classifies
+    # nodes without listing each node directory again.
+    parent_nodes.update(rel_summary.parent.parent for _, rel_summary in visible)
 
-        node_path = (
-            "." if summary_path.parent == kg_root else str(summary_path.parent.relative_to(kg_root))
-        )
+    documents: List[SearchDocument] = []
+    for summary_path, rel_summary in visible:
+        node_rel = rel_summary.parent
+        node_path = str(node_rel)  # "." for the root summary
         try:
             raw = summary_path.read_text()
         except OSError:
@@ -148,7 +163,7 @@ def scan_search_documents(kg_root: Path) -> List[SearchDocument]:
         documents.append(
             SearchDocument(
                 path=node_path,
-                kind=_kind(kg_root, node_path),
+                kind=_kind(node_rel, parent_nodes),
                 title=title,
                 aliases=[str(alias) for alias in meta.get("aliases", []) if alias is not None],
                 headings=_headings(content),
@@ -162,16 +177,23 @@ def scan_search_documents(kg_root: Path) -> List[SearchDocument]:
 
 def _score_document(
     doc: SearchDocument,
-    query: str,
     query_tokens: Sequence[str],
     idf: Dict[str, float],
 ) -> Tuple[float, Set[str]]:
-    query_norm = _normalize_text(query)
-    path_norm = _normalize_text(doc.path.replace("/", " ").replace("_", " "))
-    title_norm = _normalize_text(doc.title)
-    aliases_norm = _normalize_text(" ".join(doc.aliases))
-    headings_norm = _normalize_text(" ".join(doc.headings))
-    body_norm = _normalize_text(doc.content)
+    # Tokenize each field once: its normalized text is the tokens re-joined, and
+    # the per-token counts below reuse the same lists instead of re-tokenizing
+    # every field for every query token.
+    query_norm = " ".join(query_tokens)
+    path_tokens = _tokens(doc.path.replace("/", " ").replace("_", " "))
+    title_tokens = _tokens(doc.title)
+    aliases_tokens = _tokens(" ".join(doc.aliases))
+    headings_tokens = _tokens(" ".join(doc.headings))
+    body_tokens = _tokens(doc.content)
+    path_norm = " ".join(path_tokens)
+    title_norm = " ".join(title_tokens)
+    aliases_norm = " ".join(aliases_tokens)
+    headings_norm = " ".join(headings_tokens)
+    body_norm = " ".join(body_tokens)
 
     score = 0.0
     matched_fields: Set[str] = set()
@@ -188,17 +210,17 @@ def _score_document(
     )
     score += _phrase_score(query_norm, body_norm, "body", matched_fields, exact=0.0, contains=18.0)
 
-    fields = {
-        "path": (path_norm, 8.0),
-        "title": (title_norm, 6.0),
-        "aliases": (aliases_norm, 6.0),
-        "headings": (headings_norm, 4.0),
-        "body": (body_norm, 1.0),
-    }
+    fields = (
+        ("path", path_tokens, 8.0),
+        ("title", title_tokens, 6.0),
+        ("aliases", aliases_tokens, 6.0),
+        ("headings", headings_tokens, 4.0),
+        ("body", body_tokens, 1.0),
+    )
     for token in query_tokens:
         token_idf = idf.get(token, 1.0)
-        for field_name, (field_text, weight) in fields.items():
-            count = _tokens(field_text).count(token)
+        for field_name, field_tokens, weight in fields:
+            count = field_tokens.count(token)
             if count:
                 matched_fields.add(field_name)
                 score += token_idf * weight * (count / (count + 1.2))
@@ -227,17 +249,15 @@ def _phrase_score(
 
 def _idf(documents: Sequence[SearchDocument], query_tokens: Sequence[str]) -> Dict[str, float]:
     n = max(len(documents), 1)
-    values: Dict[str, float] = {}
-    for token in set(query_tokens):
-        df = 0
-        for doc in documents:
-            corpus = " ".join(
-                [doc.path, doc.title, " ".join(doc.aliases), " ".join(doc.headings), doc.content]
-            )
-            if token in set(_tokens(corpus)):
-                df += 1
-        values[token] = math.log((n + 1) / (df + 1)) + 1.0
-    return values
+    unique_tokens = set(query_tokens)
+    df = dict.fromkeys(unique_tokens, 0)
+    for doc in documents:
+        corpus = " ".join(
+            [doc.path, doc.title, " ".join(doc.aliases), " ".join(doc.headings), doc.content]
+        )
+        for token in unique_tokens.intersection(_tokens(corpus)):
+            df[token] += 1
+    return {token: math.log((n + 1) / (count + 1)) + 1.0 for token, count in df.items()}
 
 
 def _snippet(
@@ -246,16 +266,15 @@ def _snippet(
     query_tokens: Sequence[str],
     max_chars: int = _SNIPPET_MAX_CHARS,
 ) -> str:
-    text = re.sub(r"\s+", " ", doc.content).strip()
+    text = _WHITESPACE_RE.sub(" ", doc.content).strip()
     if not text:
         return doc.title
     haystack = text.lower()
     needle = query.lower().strip()
     idx = haystack.find(needle) if needle else -1
     if idx < 0:
-        token_positions = [
-            haystack.find(token) for token in query_tokens if haystack.find(token) >= 0
-        ]
+        positions = (haystack.find(token) for token in query_tokens)
+        token_positions = [pos for pos in positions if pos >= 0]
         idx = min(token_positions) if token_positions else 0
 
     start = max(0, idx - max_chars // 3)
@@ -281,10 +300,6 @@ def _tokens(value: str) -> List[str]:
     return _TOKEN_RE.findall(value.lower())
 
 
-def _normalize_text(value: str) -> str:
-    return " ".join(_tokens(value))
-
-
 def _headings(markdown: str) -> List[str]:
     return [match.group(1).strip() for match in _H_RE.finditer(markdown)]
 
@@ -302,29 +317,43 @@ def _title(path: str, meta: Dict[str, Any], content: str) -> str:
     return path.split("/")[-1].replace("_", " ").title()
 
 
-def _kind(kg_root: Path, path: str) -> str:
-    if path == ".":
+def _kind(node_rel: Path, parent_nodes: Set[Path]) -> str:
+    if node_rel == Path("."):
         return "root"
-    parts = Path(path).parts
-    node_dir = kg_root / path
-    has_child_nodes = any(
-        child.is_dir() and not child.name.startswith(".") and (child / "_summary.md").exists()
-        for child in _safe_iterdir(node_dir)
-    )
-    if len(parts) < 2 or has_child_nodes:
+    if len(node_rel.parts) < 2 or node_rel in parent_nodes:
         return "category"
     return "entity"
 
 
-def _safe_iterdir(path: Path) -> Iterable[Path]:
-    try:
-        return list(path.iterdir())
-    except OSError:
-        return []
-
+def _walk_visible_summaries(kg_root: Path) -> Tuple[List[Path], Set[Path]]:
+    """Return sorted visible ``_summary.md`` paths and nodes with symlinked child nodes.
 
-def _is_hidden(parts: Sequence[str]) -> bool:
-    return any(part.startswith(".") for part in parts)
+    Hidden directories are skipped and symlinked directories are not descended
+    into. The operations layer still counts a symlinked child directory with a
+    ``_summary.md`` as a child node, so its parent is recorded here to keep
+    ``kind`` consistent with ``read_node``.
+    """
+    summaries: List[Path] = []
+    symlink_parents: Set[Path] = set()
+    pending = [kg_root]
+    while pending:
+        node_dir = pending.pop()
+        try:
+            with os.scandir(node_dir) as entries:
+                for entry in entries:
+                    if entry.name.startswith("."):
+                        continue
+                    if not entry.is_dir():
+                        if entry.name == "_summary.md":
+                            summaries.append(node_dir / entry.name)
+                    elif not entry.is_symlink():
+                        pending.append(Path(entry.path))
+                    elif os.path.exists(os.path.join(entry.path, "_summary.md")):
+                        symlink_parents.add(node_dir.relative_to(kg_root))
+        except OSError:
+            continue
+    summaries.sort()
+    return summaries, symlink_parents
 
 
 def _mtime_date(path: Path) -> str:
@@ -0,0 +1,22 @@
+"""Copy and pickle support for slotted frozen dataclasses.
+
+``dataclass(slots=True)`` needs Python 3.10, so hot value types declare
+``__slots__`` by hand. Without a ``__dict__``, ``copy`` and ``pickle`` restore
+slot state through ``setattr``, which a frozen dataclass rejects. The mixin
+supplies the state hooks ``dataclass(slots=True)`` would generate.
+"""
+
+from typing import Any, Tuple
+
+
+class FrozenSlotsMixin:
+    """Base for frozen dataclasses that declare ``__slots__`` by hand."""
+
+    __slots__ = ()
+
+    def __getstate__(self) -> Tuple[Any, ...]:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state: Tuple[Any, ...]) -> None:
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
@@ -20,6 +20,10 @@ from typing import Any, Dict, List, Optional
 from kvault.core.frontmatter import parse_frontmatter
 from kvault.core.paths import PathSafetyError, resolve_within_root
 
+_ID_STRIP_RE = re.compile(r"[^a-z0-9\s]")
+_ID_SPACE_RE = re.compile(r"\s+")
+_ID_UNDERSCORES_RE = re.compile(r"_+")
+
 
 def normalize_entity_id(name: str) -> str:
     """Convert entity name to a normalized ID.
@@ -37,9 +41,9 @@ def normalize_entity_id(name: str) -> str:
     """
     name = name.lower()
     name = name.replace("_", " ")
-    name = re.sub(r"[^a-z0-9\s]", "", name)
-    name = re.sub(r"\s+", "_", name)
-    name = re.sub(r"_+", "_", name)
+    name = _ID_STRIP_RE.sub("", name)
+    name = _ID_SPACE_RE.sub("_", name)
+    name = _ID_UNDERSCORES_RE.sub("_", name)
     return name.strip("_")
 
 
@@ -418,13 +422,10 @@ def scan_entities(kg_root: Path) -> List[EntityRecord]:
         if not name:
             name = entity_dir.name
 
-        # Extract email domains
-        email_domains = []
-        for a in aliases:
-            if "@" in a:
-                domain = a.split("@")[-1].lower()
-                if domain not in email_domains:
-                    email_domains.append(domain)
+        # Extract email domains (dict.fromkeys dedupes in first-seen order)
+        email_domains = list(
+            dict.fromkeys(a.rsplit("@", 1)[-1].lower() for a in aliases if "@" in a)
+        )
 
         category = rel_path.parts[0]
 
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import re
+from collections import Counter
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Sequence, Set, Tuple
@@ -10,6 +11,9 @@ from typing import Any, Dict, Iterable, List, Sequence, Set, Tuple
 from kvault.core.frontmatter import parse_frontmatter
 
 _SUMMARY_NAME = "_summary.md"
+_WORD_RE = re.compile(r"\b[\w'-]+\b")
+_H1_RE = re.compile(r"^#\s+(.+?)\s*$")
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
 
 _PLACEHOLDER_PATTERNS: Tuple[Tuple[str, re.Pattern[str]], ...] = (
     ("summary pending", re.compile(r"\bsummary\s+pending\b", re.IGNORECASE)),
@@ -52,7 +56,10 @@ def audit_summary_quality(kg_root: Path) -> List[SummaryQualityIssue]:
     root = Path(kg_root)
     issues: List[SummaryQualityIssue] = []
 
-    for summary_path in sorted(root.rglob(_SUMMARY_NAME)):
+    summary_paths = sorted(root.rglob(_SUMMARY_NAME))
+    descendant_counts = _descendant_summary_counts(root, summary_paths)
+
+    for summary_path in summary_paths:
         parent_dir = summary_path.parent
         if _is_hidden_path(root, parent_dir):
             continue
@@ -65,7 +72,7 @@ def audit_summary_quality(kg_root: Path) -> List[SummaryQualityIssue]:
         raw = _safe_read(summary_path)
         _, body = parse_frontmatter(raw)
         word_count = _word_count(body)
-        descendant_count = _descendant_summary_count(root, parent_dir)
+        descendant_count = descendant_counts[parent_dir.relative_to(root)]
 
         min_words = _minimum_word_count(len(children), descendant_count)
         if word_count < min_words:
@@ -158,15 +165,15 @@ def _display_summary_path(kg_root: Path, summary_path: Path) -> str:
     return str(summary_path.relative_to(kg_root))
 
 
-def _descendant_summary_count(kg_root: Path, parent_dir: Path) -> int:
-    count = 0
-    for summary_path in parent_dir.rglob(_SUMMARY_NAME):
-        if summary_path.parent == parent_dir:
-            continue
+def _descendant_summary_counts(kg_root: Path, summary_paths: Iterable[Path]) -> Counter[Path]:
+    # One pass over the KB-wide scan: each visible summary counts toward every
+    # ancestor directory, keyed by path relative to kg_root.
+    counts: Counter[Path] = Counter()
+    for summary_path in summary_paths:
         if _is_hidden_path(kg_root, summary_path.parent):
             continue
-        count += 1
-    return count
+        counts.update(summary_path.parent.relative_to(kg_root).parents)
+    return counts
 
 
 def _minimum_word_count(child_count: int, descendant_count: int) -> int:
@@ -174,24 +181,25 @@ def _minimum_word_count(child_count: int, descendant_count: int) -> int:
 
 
 def _word_count(markdown: str) -> int:
-    return len(re.findall(r"\b[\w'-]+\b", markdown))
+    return len(_WORD_RE.findall(markdown))
 
 
 def _missing_child_coverage(parent_body: str, child_dirs: Iterable[Path]) -> List[str]:
-    normalized_parent = _normalize_text(parent_body)
+    # Pad once so every term check is a plain substring test on word boundaries.
+    padded_parent = f" {_normalize_text(parent_body)} "
     missing = []
     for child_dir in child_dirs:
         terms = _child_terms(child_dir)
-        if not any(_term_in_text(term, normalized_parent) for term in terms):
+        if not any(_term_in_text(term, padded_parent) for term in terms):
             missing.append(child_dir.name)
     return missing
 
 
-def _term_in_text(term: str, normalized_text: str) -> bool:
+def _term_in_text(term: str, padded_text: str) -> bool:
     normalized_term = _normalize_text(term)
     if not normalized_term:
         return False
-    return f" {normalized_term} " in f" {normalized_text} "
+    return f" {normalized_term} " in padded_text
 
 
 def _child_terms(child_dir: Path) -> Set[str]:
@@ -221,7 +229,7 @@ def _child_terms(child_dir: Path) -> Set[str]:
 
 def _first_heading(markdown: str) -> str:
     for line in markdown.splitlines():
-        match = re.match(r"^#\s+(.+?)\s*$", line)
+        match = _H1_RE.match(line)
         if match:
             return match.group(1).strip()
     return ""
@@ -229,8 +237,8 @@ def _first_heading(markdown: str) -> str:
 
 def _normalize_text(value: str) -> str:
     normalized = value.lower().replace("_", " ")
-    normalized = re.sub(r"[^a-z0-9]+", " ", normalized)
-    return re.sub(r"\s+", " ", normalized).strip()
+    # Whitespace is non-alphanumeric, so this single pass also collapses runs of it.
+    return _NON_ALNUM_RE.sub(" ", normalized).strip()
 
 
 def _placeholder_hits(markdown: str) -> List[str]:
@@ -6,7 +6,68 @@ Shared validation logic used by both the MCP server and CLI commands.
 import re
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+_NON_DIGIT_RE = re.compile(r"\D")
+_PATH_COMPONENT_RE = re.compile(r"^[a-z][a-z0-9_]*$")
+# Optional +1 country code followed by a 10-digit number: +1 (555) 123-4567, 555-123-4567
+_PHONE_RE = re.compile(r"(?:\+1[- ]?)?\(?\d{3}\)?[- ]?\d{3}[- ]?\d{4}")
+_EMAIL_RE = re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")
+# One or two capitalized words: candidate person/organization names
+_NAME_RE = re.compile(r"\b([A-Z][a-z]{2,}(?:\s+[A-Z][a-z]{2,})?)\b")
+
+# Capitalized words that extract_identifiers never reports as names.
+_COMMON_WORDS = frozenset(
+    {
+        "the",
+        "and",
+        "for",
+        "are",
+        "but",
+        "not",
+        "you",
+        "all",
+        "can",
+        "had",
+        "her",
+        "was",
+        "one",
+        "our",
+        "out",
+        "day",
+        "get",
+        "has",
+        "him",
+        "his",
+        "how",
+        "its",
+        "may",
+        "new",
+        "now",
+        "old",
+        "see",
+        "two",
+        "way",
+        "who",
+        "boy",
+        "did",
+        "let",
+        "put",
+        "say",
+        "she",
+        "too",
+        "use",
+    }
+)
+_REQUIRED_FRONTMATTER_FIELDS = ("created", "updated", "source", "aliases")
+
+# Journal heading verb and detail line per action type; unknown types get neither.
+_JOURNAL_ACTION_LINES: Dict[str, Tuple[str, str]] = {
+    "create": ("Created", "- Created new entity at [{path}](../{path}/)"),
+    "update": ("Updated", "- Updated entity at [{path}](../{path}/)"),
+    "delete": ("Deleted", "- Removed entity at {path}"),
+    "move": ("Moved", "- Moved from {path} to [{target}](../{target}/)"),
+}
 
 
 class ErrorCode(Enum):
@@ -71,7 +132,7 @@ def normalize_phone(phone: str) -> str:
         Normalized phone number or original if can't parse
     """
     # Remove all non-digit characters
-    digits = re.sub(r"\D", "", phone)
+    digits = _NON_DIGIT_RE.sub("", phone)
 
     # Handle different formats
     if len(digits) == 10:
@@ -98,8 +159,7 @@ def normalize_path(path: str) -> str:
         Normalized path
     """
     path = path.rstrip("/")
-    path = re.sub(r"/_summary\.md$", "", path)
-    return path.lower()
+    return path.removesuffix("/_summary.md").lower()
 
 
 def validate_entity_path(path: str) -> Tuple[bool, Optional[str]]:
@@ -122,7 +182,7 @@ def validate_entity_path(path: str) -> Tuple[bool, Optional[str]]:
 
     # Check each part is valid identifier
     for part in parts:
-        if not re.match(r"^[a-z][a-z0-9_]*$", part):
+        if not _PATH_COMPONENT_RE.match(part):
             return (
                 False,
                 f"Invalid path component: '{part}' (must be lowercase alphanumeric with underscores)",
@@ -142,8 +202,7 @@ def validate_frontmatter(meta: Dict[str, Any]) -> Tuple[bool, List[str]]:
     Returns:
         Tuple of (is_valid, list_of_missing_fields)
     """
-    required = ["created", "updated", "source", "aliases"]
-    missing = [f for f in required if f not in meta]
+    missing = [f for f in _REQUIRED_FRONTMATTER_FIELDS if f not in meta]
     return len(missing) == 0, missing
 
 
@@ -206,69 +265,24 @@ def extract_identifiers(text: str) -> Dict[str, List[str]]:
     Returns:
         Dictionary with 'phones', 'emails', 'names' keys
     """
-    # Phone patterns
-    phone_patterns = [
-        r"\+1[- ]?\(?\d{3}\)?[- ]?\d{3}[- ]?\d{4}",  # +1 (555) 123-4567
-        r"\(?\d{3}\)?[- ]?\d{3}[- ]?\d{4}",  # (555) 123-4567
-    ]
-    phones = []
-    for pattern in phone_patterns:
-        matches = re.findall(pattern, text)
-        phones.extend([normalize_phone(m) for m in matches])
-
-    # Email pattern
-    email_pattern = r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}"
-    emails = re.findall(email_pattern, text)
-
-    # Name pattern (capitalized words, excluding common words)
-    common_words = {
-        "the",
-        "and",
-        "for",
-        "are",
-        "but",
-        "not",
-        "you",
-        "all",
-        "can",
-        "had",
-        "her",
-        "was",
-        "one",
-        "our",
-        "out",
-        "day",
-        "get",
-        "has",
-        "him",
-        "his",
-        "how",
-        "its",
-        "may",
-        "new",
-        "now",
-        "old",
-        "see",
-        "two",
-        "way",
-        "who",
-        "boy",
-        "did",
-        "let",
-        "put",
-        "say",
-        "she",
-        "too",
-        "use",
-    }
-    name_pattern = r"\b([A-Z][a-z]{2,}(?:\s+[A-Z][a-z]{2,})?)\b"
-    potential_names = re.findall(name_pattern, text)
-    names = [n for n in potential_names if n.lower().split()[0] not in common_words]
+    phones = {normalize_phone(match.group()) for match in _PHONE_RE.finditer(text)}
+
+    # Every email contains "@"; skip the regex scan over text that has none
+    emails: Set[str] = set()
+    if "@" in text:
+        emails.update(match.group() for match in _EMAIL_RE.finditer(text))
+
+    # Capitalized words, excluding common words
+    names: Set[str] = set()
+    for match in _NAME_RE.finditer(text):
+        name = match.group(1)
+        if name.lower().split()[0] not in _COMMON_WORDS:
+            names.add(name)
 
     return {
-        "phones": list(set(phones)),
-        "emails": list(set(emails)),
-        "names": list(set(names)),
+        "phones": list(phones),
+        "emails": list(emails),
+        "names": list(names),
     }
 
 
@@ -307,19 +321,12 @@ def format_journal_entry(
         action_type = action.get("action_type", "unknown")
         path = action.get("path", "unknown")
 
-        if action_type == "create":
-            lines.append(f"### Created {path.split('/')[-1]}")
-            lines.append(f"- Created new entity at [{path}](../{path}/)")
-        elif action_type == "update":
-            lines.append(f"### Updated {path.split('/')[-1]}")
-            lines.append(f"- Updated entity at [{path}](../{path}/)")
-        elif action_type == "delete":
-            lines.append(f"### Deleted {path.split('/')[-1]}")
-            lines.append(f"- Removed entity at {path}")
-        elif action_type == "move":
+        template = _JOURNAL_ACTION_LINES.get(action_type)
+        if template is not None:
+            verb, detail = template
             target = action.get("target_path", "unknown")
-            lines.append(f"### Moved {path.split('/')[-1]}")
-            lines.append(f"- Moved from {path} to [{target}](../{target}/)")
+            lines.append(f"### {verb} {path.split('/')[-1]}")
+            lines.append(detail.format(path=path, target=target))
 
         if action.get("reasoning"):
             lines.append(f"- Reason: {action['reasoning']}")
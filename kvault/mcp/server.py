@@ -458,12 +458,46 @@ def create_server(kb_root: Path | str) -> Any:
             return err
         assert root is not None
         try:
-            logger = ObservabilityLogger(root / ".kvault" / "logs.db")
-            logger.log(phase, data)
+            with ObservabilityLogger(root / ".kvault" / "logs.db") as logger:
+                logger.log(phase, data)
         except ValueError as exc:
             return error_response(ErrorCode.VALIDATION_ERROR, str(exc))
         return success_response({"session_id": logger.session_id, "phase": phase})
 
+    @server.tool(name="kvault_log_phases")
+    def kvault_log_phases(
+        entries: List[Dict[str, Any]],
+        kg_root: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Log several observability phases to .kvault/logs.db in one commit.
+
+        Each entry is ``{"phase": ..., "data": {...}}``. Entries are validated
+        up front, so an invalid one logs nothing.
+        """
+        root, err = _tool_root(bound_root, kg_root)
+        if err:
+            return err
+        assert root is not None
+        pairs = []
+        for index, entry in enumerate(entries):
+            if not isinstance(entry, dict) or not isinstance(entry.get("data"), dict):
+                return error_response(
+                    ErrorCode.VALIDATION_ERROR,
+                    f"entries[{index}] must be an object with 'phase' and object 'data'",
+                )
+            pairs.append((str(entry.get("phase", "")), entry["data"]))
+        try:
+            with ObservabilityLogger(root / ".kvault" / "logs.db") as logger:
+                logger.log_many(pairs)
+        except ValueError as exc:
+            return error_response(ErrorCode.VALIDATION_ERROR, str(exc))
+        return success_response(
+            {
+                "session_id": logger.session_id,
+                "phases": [phase for phase, _ in pairs],
+            }
+        )
+
     return server
 
 
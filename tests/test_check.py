@@ -100,6 +100,23 @@ def test_propagation_falls_back_to_mtime(tmp_path):
     assert "newer" in prop_warnings[0]
 
 
+def test_propagation_parses_each_summary_once(sample_kb, monkeypatch):
+    """Interior summaries are both parent and child but are only parsed once."""
+    from kvault.cli import check
+
+    calls = []
+
+    def counting(path):
+        calls.append(path)
+        return _get_updated_date(path)
+
+    monkeypatch.setattr(check, "_get_updated_date", counting)
+    check_propagation(sample_kb, threshold_minutes=5)
+
+    assert calls
+    assert len(calls) == len(set(calls))
+
+
 # ── write_entity ancestors tests ─────────────────────────────────────
 
 
@@ -81,6 +81,20 @@ class TestHelp:
 # ============================================================================
 
 
+class TestInitCommand:
+    def test_init_renders_templates(self, runner, tmp_path):
+        kb = tmp_path / "new_kb"
+        result = runner.invoke(cli, ["init", str(kb), "--name", "Ada {{DATE}}"])
+        assert result.exit_code == 0, result.output
+
+        root = (kb / "_summary.md").read_text()
+        assert "Ada {{DATE}}" in root
+        assert "{{OWNER_NAME}}" not in root
+        people = (kb / "people" / "_summary.md").read_text()
+        assert "{{" not in people
+        assert "People" in people
+
+
 class TestTree:
     def test_default_depth_unlimited(self, runner, cli_kb_with_entity):
         result = runner.invoke(cli, ["--kb-root", str(cli_kb_with_entity), "tree"])
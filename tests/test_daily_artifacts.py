@@ -23,6 +23,25 @@ def test_generate_daily_artifact_creates_expected_sections(sample_kb):
     assert "All tracked contacts" in result.content
 
 
+def test_generate_daily_artifact_picks_keyword_sections(sample_kb):
+    """Goal and project sections are chosen by heading keywords."""
+    (sample_kb / "_summary.md").write_text(
+        "# Root\n\n## Background\nOld context.\n\n## North Star Objectives\nShip v1.\n"
+    )
+    (sample_kb / "projects" / "_summary.md").write_text(
+        "# Projects\n\n## Archive\nDone.\n\n## Upcoming Work\nLaunch beta.\n"
+    )
+
+    result = generate_daily_artifact(sample_kb, artifact_date=date(2026, 2, 10), force=True)
+
+    goals = result.content.split("## Goals Snapshot", 1)[1].split("## Near-Future Context", 1)[0]
+    assert "## North Star Objectives\nShip v1." in goals
+    assert "Old context." not in goals
+    signals = result.content.split("### Project Signals", 1)[1].split("### Recent Journal", 1)[0]
+    assert "## Upcoming Work\nLaunch beta." in signals
+    assert "Done." not in signals
+
+
 def test_generate_daily_artifact_reuses_existing_file(sample_kb):
     """Without force, existing artifact should be reused rather than overwritten."""
     first = generate_daily_artifact(sample_kb, artifact_date=date(2026, 2, 10), force=True)
@@ -4,6 +4,7 @@ import json
 import os
 import subprocess
 import sys
+import threading
 import time
 from pathlib import Path
 
@@ -257,6 +258,27 @@ def test_lock_is_reentrant_within_process(tmp_path):
     assert not (root / ".kvault" / "lock").exists()
 
 
+def test_lock_blocks_other_thread_in_same_process(tmp_path):
+    root = tmp_path / "kb"
+    root.mkdir()
+    errors = []
+
+    def contend():
+        try:
+            KBWriteLock(root, timeout=0.5).acquire()
+        except LockError as exc:
+            errors.append(exc)
+
+    with KBWriteLock(root):
+        worker = threading.Thread(target=contend)
+        worker.start()
+        worker.join(timeout=10)
+        assert (root / ".kvault" / "lock").exists()
+
+    assert len(errors) == 1
+    assert not (root / ".kvault" / "lock").exists()
+
+
 def test_lock_blocks_second_process(tmp_path):
     root = tmp_path / "kb"
     root.mkdir()
@@ -10,14 +10,13 @@ from kvault.core.observability import ObservabilityLogger
 
 def test_log_summary_json_defaults_to_latest_session(tmp_path):
     db_path = tmp_path / "logs.db"
-    logger = ObservabilityLogger(db_path)
+    with ObservabilityLogger(db_path) as logger:
+        first_session = logger.session_id
+        logger.log("research", {"query": "alice"})
 
-    first_session = logger.session_id
-    logger.log("research", {"query": "alice"})
-
-    logger.new_session()
-    latest_session = logger.session_id
-    logger.log("decide", {"entity": "Alice", "action": "create", "reasoning": "No match"})
+        logger.new_session()
+        latest_session = logger.session_id
+        logger.log("decide", {"entity": "Alice", "action": "create", "reasoning": "No match"})
 
     runner = CliRunner()
     result = runner.invoke(cli, ["log", "summary", "--db", str(db_path), "--json"])
@@ -31,13 +30,12 @@ def test_log_summary_json_defaults_to_latest_session(tmp_path):
 
 def test_log_summary_json_honors_explicit_session_id(tmp_path):
     db_path = tmp_path / "logs.db"
-    logger = ObservabilityLogger(db_path)
-
-    first_session = logger.session_id
-    logger.log("research", {"query": "alice"})
+    with ObservabilityLogger(db_path) as logger:
+        first_session = logger.session_id
+        logger.log("research", {"query": "alice"})
 
-    logger.new_session()
-    logger.log("decide", {"entity": "Alice", "action": "create", "reasoning": "No match"})
+        logger.new_session()
+        logger.log("decide", {"entity": "Alice", "action": "create", "reasoning": "No match"})
 
     runner = CliRunner()
     result = runner.invoke(
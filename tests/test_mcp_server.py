@@ -9,6 +9,7 @@ import click
 import pytest
 from click.testing import CliRunner
 
+from kvault.core.observability import ObservabilityLogger
 from kvault.mcp.server import KVAULT_KB_ROOT_ENV, create_server, main, resolve_bound_root
 
 pytest.importorskip("mcp.server.fastmcp")
@@ -90,6 +91,7 @@ def test_mcp_server_exposes_compatible_tools_and_calls(tmp_path):
         "kvault_generate_daily_artifact",
         "kvault_validate_kb",
         "kvault_log_phase",
+        "kvault_log_phases",
     }.issubset(tool_names)
 
     status = _run_tool(server, "kvault_status", {})
@@ -137,6 +139,37 @@ def test_mcp_server_exposes_compatible_tools_and_calls(tmp_path):
     )
 
 
+def test_mcp_log_phases_writes_batch_or_nothing(tmp_path):
+    kb = _make_kb(tmp_path)
+    server = create_server(kb)
+
+    logged = _run_tool(
+        server,
+        "kvault_log_phases",
+        {
+            "entries": [
+                {"phase": "research", "data": {"query": "alice"}},
+                {"phase": "decide", "data": {"entity": "Alice", "action": "create"}},
+            ]
+        },
+    )
+    assert logged["success"] is True
+    assert logged["phases"] == ["research", "decide"]
+
+    rejected = _run_tool(
+        server,
+        "kvault_log_phases",
+        {"entries": [{"phase": "research", "data": {}}, {"phase": "bogus", "data": {}}]},
+    )
+    assert rejected["success"] is False
+    assert rejected["error_code"] == "validation_error"
+
+    with ObservabilityLogger(kb / ".kvault" / "logs.db") as logger:
+        summary = logger.get_session_summary(logged["session_id"])
+        assert summary["phase_counts"] == {"research": 1, "decide": 1}
+        assert logger.list_sessions() == [logged["session_id"]]
+
+
 def test_mcp_strict_summary_update_tools_prepare_and_write(tmp_path):
     kb = _make_kb(tmp_path)
     server = create_server(kb)
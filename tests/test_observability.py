@@ -0,0 +1,83 @@
+"""Tests for kvault.core.observability.ObservabilityLogger."""
+
+import sqlite3
+
+import pytest
+
+from kvault.core.observability import ObservabilityLogger
+
+
+def test_log_many_writes_entries_in_order(tmp_path):
+    with ObservabilityLogger(tmp_path / "logs.db") as logger:
+        logger.log_many(
+            [
+                ("research", {"query": "alice"}),
+                ("decide", {"entity": "Alice", "action": "create", "reasoning": "No match"}),
+                ("step_write", {"path": "people/alice"}),
+            ]
+        )
+        entries = logger.get_session()
+
+    assert [entry.phase for entry in entries] == ["research", "decide", "step_write"]
+    assert entries[1].data["action"] == "create"
+    assert all(entry.session == logger.session_id for entry in entries)
+
+
+def test_log_many_rejects_invalid_phase_without_writing(tmp_path):
+    with ObservabilityLogger(tmp_path / "logs.db") as logger:
+        with pytest.raises(ValueError, match="Invalid phase"):
+            logger.log_many([("research", {"query": "alice"}), ("bogus", {})])
+
+        assert logger.get_session() == []
+
+
+def test_logger_reuses_one_connection_and_reopens_after_close(tmp_path):
+    logger = ObservabilityLogger(tmp_path / "logs.db")
+    logger.log("research", {"query": "alice"})
+    conn = logger._conn
+    logger.log("decide", {"entity": "Alice", "action": "create", "reasoning": "No match"})
+    assert logger._conn is conn
+
+    logger.close()
+    assert logger._conn is None
+    assert [entry.phase for entry in logger.get_session()] == ["research", "decide"]
+    logger.close()
+
+
+def test_logger_context_manager_closes_connection(tmp_path):
+    with ObservabilityLogger(tmp_path / "logs.db") as logger:
+        logger.log("input", {"items": [], "count": 0, "source": None})
+    assert logger._conn is None
+
+
+def test_logger_uses_wal_journal(tmp_path):
+    db_path = tmp_path / "logs.db"
+    with ObservabilityLogger(db_path) as logger:
+        logger.log("research", {"query": "alice"})
+        assert logger._conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+
+    conn = sqlite3.connect(db_path)
+    try:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    finally:
+        conn.close()
+
+
+def test_phase_queries_use_phase_ts_index(tmp_path):
+    with ObservabilityLogger(tmp_path / "logs.db") as logger:
+        logger.log("error", {"error_type": "x", "entity": "e", "resolution": "r"})
+
+        with logger._db() as conn:
+            plan = " ".join(
+                row[-1]
+                for row in conn.execute(
+                    "EXPLAIN QUERY PLAN SELECT * FROM logs WHERE phase = 'error' "
+                    "AND ts >= ? ORDER BY ts DESC LIMIT ?",
+                    ("2026-01-01", 10),
+                )
+            )
+            indexes = {row[1] for row in conn.execute("PRAGMA index_list(logs)")}
+
+    assert "idx_phase_ts" in plan
+    assert "TEMP B-TREE" not in plan
+    assert "idx_phase" not in indexes
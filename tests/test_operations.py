@@ -7,6 +7,7 @@ import shutil
 
 import pytest
 from kvault.core import operations as ops
+from kvault.core.search import scan_search_documents
 
 # ============================================================================
 # Fixtures
@@ -271,6 +272,16 @@ class TestWriteNode:
             ".",
         ]
 
+    def test_non_object_meta_rejected_before_node_lookup(self, empty_ops_kb):
+        result = ops.write_node(
+            empty_ops_kb,
+            "people/friends/nobody",
+            "# Nobody\n",
+            meta=["not", "a", "dict"],
+        )
+        assert result["error_code"] == "validation_error"
+        assert "must be an object" in result["error"]
+
 
 # ============================================================================
 # Strict parent summary updates
@@ -593,6 +604,17 @@ class TestListNodes:
         paths = [node["path"] for node in nodes]
         assert "people/friends/alice_smith" in paths
 
+    def test_list_recursive_nodes_is_sorted_preorder(self, ops_kb):
+        paths = [node["path"] for node in ops.list_nodes(ops_kb, "people", recursive=True)]
+        assert paths == [
+            "people/friends",
+            "people/friends/alice_smith",
+            "people/friends/jose_garcia",
+            "people/work",
+            "people/work/bob_jones",
+            "people/work/sarah_chen",
+        ]
+
 
 class TestSearchNodes:
     def test_search_returns_node_hits(self, ops_kb):
@@ -631,6 +653,34 @@ class TestSearchNodes:
         assert result["results"][0]["path"] == "projects/long_note"
         assert len(snippet) > 400
 
+    def test_search_classifies_node_kinds(self, ops_kb):
+        _add_child(ops_kb, "people/friends/alice_smith", "notes")
+        hidden = ops_kb / "people" / "work" / "sarah_chen" / ".drafts"
+        hidden.mkdir(parents=True)
+        (hidden / "_summary.md").write_text("# Draft\n")
+
+        kinds = {doc.path: doc.kind for doc in scan_search_documents(ops_kb)}
+
+        assert kinds["people"] == "category"
+        assert kinds["people/friends"] == "category"
+        assert kinds["people/friends/alice_smith"] == "category"
+        assert kinds["people/work/sarah_chen"] == "entity"
+        assert kinds["."] == "root"
+
+    def test_search_kind_matches_read_node_for_symlinked_child(self, ops_kb, tmp_path):
+        target = tmp_path / "outside_notes"
+        target.mkdir()
+        (target / "_summary.md").write_text("# Notes\n")
+        (ops_kb / "people" / "work" / "sarah_chen" / "notes").symlink_to(
+            target, target_is_directory=True
+        )
+
+        kinds = {doc.path: doc.kind for doc in scan_search_documents(ops_kb)}
+
+        node = ops.read_node(ops_kb, "people/work/sarah_chen")
+        assert node["kind"] == "category"
+        assert kinds["people/work/sarah_chen"] == node["kind"]
+
     def test_search_ignores_hidden_directories(self, ops_kb):
         hidden = ops_kb / ".hidden" / "secret"
         hidden.mkdir(parents=True)
@@ -661,6 +711,31 @@ class TestWriteJournal:
         journal = empty_ops_kb / result["journal_path"]
         assert journal.exists()
 
+    def test_write_journal_formats_each_action_type(self, empty_ops_kb):
+        result = ops.write_journal(
+            empty_ops_kb,
+            actions=[
+                {"action_type": "create", "path": "people/friends/bob"},
+                {"action_type": "update", "path": "people/friends/amy"},
+                {"action_type": "delete", "path": "people/friends/old"},
+                {
+                    "action_type": "move",
+                    "path": "people/friends/cal",
+                    "target_path": "people/work/cal",
+                },
+                {"action_type": "noted", "path": "people/friends/dee"},
+            ],
+            source="test",
+        )
+        content = (empty_ops_kb / result["journal_path"]).read_text()
+        assert "### Created bob\n- Created new entity at [people/friends/bob]" in content
+        assert "### Updated amy\n- Updated entity at [people/friends/amy]" in content
+        assert "### Deleted old\n- Removed entity at people/friends/old" in content
+        assert (
+            "- Moved from people/friends/cal to [people/work/cal](../people/work/cal/)" in content
+        )
+        assert "dee" not in content
+
 
 class TestValidateKB:
     def test_validate_clean_kb(self, ops_kb):
@@ -76,3 +76,18 @@ def test_research_cache_invalidates_after_write(tmp_path):
     action, target_path, _ = researcher.suggest_action("Acme")
     assert action in ("update", "review")
     assert target_path == "customers/key/acme"
+
+
+def test_research_fuzzy_match_keeps_best_pair(tmp_path):
+    kg_root = tmp_path / "knowledge_graph"
+    _write_entity(kg_root, "people/jonathan_smith", "Jonathan Smith", ["Jon Smith"])
+    _write_entity(kg_root, "people/zed", "Zed", ["Z"])
+
+    researcher = EntityResearcher(kg_root)
+    candidates = researcher.research("Jonathon Smith")
+
+    assert [c.candidate_path for c in candidates] == ["people/jonathan_smith"]
+    best = candidates[0]
+    assert best.match_type == "fuzzy_name"
+    assert best.match_details == {"matched": "jonathon_smith", "target": "jonathan_smith"}
+    assert EntityResearcher.FUZZY_MATCH_THRESHOLD <= best.match_score < 1.0
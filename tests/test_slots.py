@@ -0,0 +1,37 @@
+"""Tests for kvault.core.slots.FrozenSlotsMixin."""
+
+import copy
+import pickle
+
+import pytest
+
+from kvault.core.research import ResearchCandidate
+from kvault.core.search import SearchDocument
+
+SLOTTED_VALUES = [
+    ResearchCandidate(
+        candidate_path="people/alice",
+        candidate_name="Alice",
+        match_type="exact",
+        match_score=1.0,
+        match_details={"matched": "alice"},
+    ),
+    SearchDocument(
+        path="people/alice",
+        kind="entity",
+        title="Alice",
+        aliases=["Al"],
+        headings=["Alice"],
+        content="# Alice\n",
+        summary_path="people/alice/_summary.md",
+        last_updated="2026-01-01",
+    ),
+]
+
+
+@pytest.mark.parametrize("value", SLOTTED_VALUES, ids=lambda v: type(v).__name__)
+def test_slotted_values_copy_and_pickle(value):
+    assert not hasattr(value, "__dict__")
+    assert copy.copy(value) == value
+    assert copy.deepcopy(value) == value
+    assert pickle.loads(pickle.dumps(value)) == value
@@ -2,7 +2,7 @@
 
 import pytest
 
-from kvault.core.storage import SimpleStorage, normalize_entity_id
+from kvault.core.storage import SimpleStorage, normalize_entity_id, scan_entities
 
 
 class TestNormalizeEntityId:
@@ -235,3 +235,21 @@ class TestSimpleStorage:
 
         name = storage.get_entity_name("people/alice")
         assert name == "Alice Smith"
+
+
+class TestScanEntities:
+    """Tests for scan_entities()."""
+
+    def test_email_domains_deduplicated_in_alias_order(self, tmp_path):
+        entity_dir = tmp_path / "people" / "alice"
+        entity_dir.mkdir(parents=True)
+        (entity_dir / "_summary.md").write_text(
+            "---\n"
+            "source: test\n"
+            "aliases: [Alice, alice@Acme.com, a.smith@acme.com, alice@home.org]\n"
+            "---\n"
+            "# Alice\n"
+        )
+
+        (entity,) = scan_entities(tmp_path)
+        assert entity.email_domains == ["acme.com", "home.org"]
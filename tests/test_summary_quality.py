@@ -53,6 +53,23 @@ def test_summary_quality_warns_on_too_short_parent_rollup(tmp_path):
     assert any(issue.code == "too_short" for issue in issues)
 
 
+def test_summary_quality_descendant_counts_skip_hidden_dirs(tmp_path):
+    kb = _basic_kb(tmp_path)
+    _write_summary(kb, ".", "# Root\n\nAlpha.")
+    _write_summary(kb, "alpha", "# Alpha\n\nOne and two.")
+    _write_summary(kb, "alpha/one", "# One\n\nLeaf.")
+    _write_summary(kb, "alpha/two", "# Two\n\nLeaf.")
+    _write_summary(kb, "alpha/two/deep", "# Deep\n\nLeaf.")
+    _write_summary(kb, "alpha/.archive/old", "# Old\n\nHidden.")
+
+    issues = audit_summary_quality(kb)
+
+    too_short = {issue.path: issue.details for issue in issues if issue.code == "too_short"}
+    assert too_short["_summary.md"]["descendant_count"] == 4
+    assert too_short["alpha/_summary.md"]["descendant_count"] == 3
+    assert too_short["alpha/two/_summary.md"]["descendant_count"] == 1
+
+
 def test_summary_quality_warns_on_placeholder_redirect_language(tmp_path):
     kb = _basic_kb(tmp_path)
     _write_summary(
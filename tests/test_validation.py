@@ -0,0 +1,33 @@
+"""Tests for kvault.core.validation module."""
+
+from kvault.core.validation import extract_identifiers
+
+
+class TestExtractIdentifiers:
+    """Tests for extract_identifiers()."""
+
+    def test_phone_formats_normalize_to_one_number(self):
+        text = "Call +1 (555) 123-4567, or 555-123-4567, or (555) 1234567."
+        assert extract_identifiers(text)["phones"] == ["+15551234567"]
+
+    def test_distinct_phones(self):
+        text = "Office 212-555-0100, mobile +1-646-555-0199"
+        phones = extract_identifiers(text)["phones"]
+        assert sorted(phones) == ["+12125550100", "+16465550199"]
+
+    def test_unseparated_prefixed_phone_yields_one_number(self):
+        # The 10-digit tail inside +1NNNNNNNNNN must not match as a second number.
+        assert extract_identifiers("Call +12125550100 today")["phones"] == ["+12125550100"]
+
+    def test_emails(self):
+        text = "Reach alice.smith@acme.com or bob+kv@example.org."
+        emails = extract_identifiers(text)["emails"]
+        assert sorted(emails) == ["alice.smith@acme.com", "bob+kv@example.org"]
+
+    def test_no_at_sign_means_no_emails(self):
+        assert extract_identifiers("alice at acme dot com")["emails"] == []
+
+    def test_names_skip_common_words(self):
+        names = extract_identifiers("The meeting with Alice Smith was great")["names"]
+        assert "Alice Smith" in names
+        assert not any(name.split()[0] == "The" for name in names)